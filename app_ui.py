@@ -1,235 +1,538 @@
 import tkinter as tk
-from PIL import Image, ImageTk
 import time
 import os
 import sys
 import traceback
+import logging
 import threading
 import ctypes
+import functools
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
 
-from monitor_manager import initialize_monitors
+from monitor_manager import initialize_monitors, APP_DATA_DIR
 import control_logic
 
 identified_monitors_global = []
 root_window = None
-
+# Set from --force-rediscover in __main__; re-probes a recently paired Tizen monitor
+FORCE_REDISCOVER = False
+
+# Input switches (DDC/CI or Tizen macro) run here so the Tk loop never blocks
+# and several monitors can switch in parallel.
+_switch_pool = ThreadPoolExecutor(max_workers=4)
+
+# Resized background PhotoImages, keyed by (path, mtime, width, height).
+# Holding the references here also keeps Tk from garbage-collecting them.
+_bg_cache = {}
+# Monitor button icon PhotoImage, shared by every monitor control and by restarts.
+_icon_cache = {}
+
+# Creates and places the three static labels of a monitor control in a single
+# Python->Tcl round-trip. Registered once per interpreter in create_gui().
+_BUILD_MON_PROC = """
+proc build_mon {frame name model src} {
+    label $frame.name -text $name -fg white -bg gray20 -font {Arial 10 bold} -wraplength 220
+    place $frame.name -x 125 -y 25 -anchor center
+    label $frame.model -text $model -fg gray80 -bg gray20 -font {Arial 9 italic}
+    place $frame.model -x 125 -y 48 -anchor center
+    label $frame.source -text $src -fg white -bg gray20 -font {Arial 9}
+    place $frame.source -x 125 -y 65 -anchor center
+}
+"""
+
+ICON_SIZE = (90, 90)
+
+# Resized images persisted between launches (see _load_cached_resized)
+IMAGE_CACHE_DIR = os.path.join(APP_DATA_DIR, 'image_cache')
+# Part of each cached file's name: change these whenever the matching resize
+# (size, filter, reducing_gap, mode conversion) changes, so stale PNGs are dropped
+_BG_TRANSFORM = "900x506-draft-bilinear"
+_ICON_TRANSFORM = f"{ICON_SIZE[0]}x{ICON_SIZE[1]}-rgba-bilinear-rg2"
+
+# Pillow is imported on first use (see _import_pil), normally by the detection
+# worker thread, so the loading screen paints before its C extensions load.
+Image = ImageTk = None
+_BILINEAR = None
+
+def _import_pil():
+    global Image, ImageTk, _BILINEAR
+    if Image is not None:
+        return
+    from PIL import Image as pil_image, ImageTk as pil_imagetk
+    # Resampling filters, bound once (Image.Resampling exists since Pillow 9.1)
+    try:
+        _BILINEAR = pil_image.Resampling.BILINEAR
+    except AttributeError:
+        _BILINEAR = pil_image.BILINEAR
+    ImageTk = pil_imagetk
+    Image = pil_image
+
+# Switch button options shared by every MonitorControl ("image" is added per call)
+_SWITCH_BTN_BASE = {
+    "compound": "center",
+    "fg": "white",
+    "bg": "gray20",
+    "font": ('Arial', 12, 'bold'),
+    "width": 120,
+    "height": 45,
+    "bd": 0,
+    "highlightthickness": 0,
+    "text": "Switch Input"
+}
+
+# (role, substrings that must all appear in the upper-cased model), checked in order.
+# "SAMSUNG" matches "Samsung OLED G8 (Local)".
+MONITOR_ROLES = (
+    ("c24g2u", ("C24G2U",)),
+    ("samsung_g8", ("SAMSUNG",)),
+)
+
+@functools.lru_cache(maxsize=None)
 def resource_path(relative_path):
+    # Stable for the process lifetime (_MEIPASS or the launch directory)
     try:
         base_path = sys._MEIPASS
     except AttributeError:
         base_path = os.path.abspath(".")
     return os.path.join(base_path, relative_path)
 
-def show_loading_screen(root_window):
+def _bg_cache_key():
+    # One stat: getmtime doubles as the existence check
+    try:
+        return (_BG_PATH, os.path.getmtime(_BG_PATH), 900, 506)
+    except OSError:
+        return None
+
+def _load_bg_image(bg_image_path):
+    """Decode and resize the background. Pure PIL, safe to run off the Tk thread."""
+    _import_pil()
+    im = Image.open(bg_image_path)
+    # The shipped background.jpg is already 900x506, so this is normally a no-op
+    if im.size == (900, 506):
+        im.load()  # decode now, while still off the Tk thread
+        return im
+    def resize():
+        # Let libjpeg decode at the nearest DCT scale, then a cheap filter
+        # is enough for a decorative background.
+        im.draft("RGB", (900, 506))
+        return im.resize((900, 506), _BILINEAR)
+    return _load_cached_resized(bg_image_path, "bg", _BG_TRANSFORM, resize)
+
+def _find_icon_path():
+    """Return (path, filename) of the monitor button icon, preferring PNG over JPG."""
+    icon_filename_png = "monitor_icon.png"
+    icon_path_png = resource_path(icon_filename_png)
+    icon_filename_jpg = "monitor_icon.jpg"
+    icon_path_jpg = resource_path(icon_filename_jpg)
+
+    if os.path.exists(icon_path_png):
+        return icon_path_png, icon_filename_png
+    if os.path.exists(icon_path_jpg):
+        print(f"Info: '{icon_filename_png}' not found, using '{icon_filename_jpg}'.")
+        return icon_path_jpg, icon_filename_jpg
+    return None, ""
+
+_BG_PATH = resource_path("background.jpg")
+_ICON_PATH, _ICON_FILENAME = _find_icon_path()
+
+def _icon_cache_key():
+    if not _ICON_PATH:
+        return None
+    try:
+        return (_ICON_PATH, _ICON_FILENAME, os.path.getmtime(_ICON_PATH), ICON_SIZE)
+    except OSError:
+        return None
+
+def _load_cached_resized(path, kind, transform, resize):
+    """
+    Return resize()'s output, persisted as a PNG in IMAGE_CACHE_DIR so later
+    launches skip the decode and resample. Keyed by file content, not path,
+    because the PyInstaller _MEIPASS directory changes on every run, and by
+    the transform tag, so a changed resize isn't served from an old PNG.
+    """
+    _import_pil()
+    with open(path, 'rb') as f:
+        digest = hashlib.sha1(f.read()).hexdigest()[:16]
+    cache_name = f"{kind}.{transform}.{digest}.png"
+    cache_file = os.path.join(IMAGE_CACHE_DIR, cache_name)
+    try:
+        im = Image.open(cache_file)
+        im.load()
+        return im
+    except OSError:
+        pass
+
+    im = resize()
+    try:
+        os.makedirs(IMAGE_CACHE_DIR, exist_ok=True)
+        tmp = cache_file + '.tmp'
+        im.save(tmp, format='PNG')
+        os.replace(tmp, cache_file)
+    except OSError as e:
+        print(f"Warning: Could not cache resized image: {e}")
+        return im
+    _prune_image_cache(kind, cache_name)
+    return im
+
+def _prune_image_cache(kind, keep):
+    """Drop this kind's superseded PNGs (old source or transform) and untagged legacy ones."""
+    try:
+        names = os.listdir(IMAGE_CACHE_DIR)
+    except OSError:
+        return
+    for name in names:
+        legacy = name.endswith('.png') and name.count('.') == 1
+        if name != keep and (name.startswith(kind + '.') or legacy):
+            try:
+                os.remove(os.path.join(IMAGE_CACHE_DIR, name))
+            except OSError:
+                pass
+
+def _load_icon_image(icon_path, loaded_filename):
+    """Load the resized monitor icon. Pure PIL, safe to run off the Tk thread."""
+    print(f"Loading icon: {loaded_filename}")
+    return _load_cached_resized(icon_path, "icon", _ICON_TRANSFORM,
+                                lambda: _resize_icon(icon_path, loaded_filename))
+
+def _resize_icon(icon_path, loaded_filename):
+    _import_pil()
+    monitor_icon_original = Image.open(icon_path)
+    mode = monitor_icon_original.mode
+    if mode != 'RGBA' and (loaded_filename.endswith('.png') or
+                           (mode == 'P' and 'transparency' in monitor_icon_original.info)):
+        monitor_icon_original = monitor_icon_original.convert('RGBA')
+
+    if monitor_icon_original.size == ICON_SIZE:
+        return monitor_icon_original
+    # reducing_gap lets Pillow box-reduce the large source first; BILINEAR is
+    # indistinguishable from sharper filters at 90x90 inside the button
+    return monitor_icon_original.resize(ICON_SIZE, _BILINEAR, reducing_gap=2.0)
+
+def _preload_images():
+    """
+    Decode the background and icon on the detection worker thread.
+    Only ImageTk.PhotoImage has to be built on the Tk thread afterwards.
+
+    Returns: (bg_pil, icon_pil) - either may be None (cached, missing or failed)
+    """
+    bg_pil = icon_pil = None
+    try:
+        key = _bg_cache_key()
+        if key and key not in _bg_cache:
+            bg_pil = _load_bg_image(key[0])
+    except Exception as e:
+        print(f"Error preloading background image: {e}")
+    try:
+        key = _icon_cache_key()
+        if key and key not in _icon_cache:
+            icon_pil = _load_icon_image(key[0], key[1])
+    except Exception as e:
+        print(f"Error preloading monitor icon: {e}")
+    return bg_pil, icon_pil
+
+def _get_bg_photo(root, bg_pil=None, load=True):
+    """
+    Return the cached background PhotoImage, or None if background.jpg is missing.
+    With load=False a cache miss without bg_pil returns None instead of decoding.
+    """
+    key = _bg_cache_key()
+    if key is None:
+        return None
+    photo = _bg_cache.get(key)
+    if photo is None:
+        if bg_pil is None:
+            if not load:
+                return None
+            bg_pil = _load_bg_image(key[0])
+        _import_pil()
+        photo = ImageTk.PhotoImage(bg_pil, master=root)
+        _bg_cache.clear()
+        _bg_cache[key] = photo
+    return photo
+
+def _get_icon_photo(root, icon_pil=None):
+    """Return the cached monitor icon PhotoImage, or None if no icon file exists."""
+    key = _icon_cache_key()
+    if key is None:
+        return None
+    photo = _icon_cache.get(key)
+    if photo is None:
+        if icon_pil is None:
+            icon_pil = _load_icon_image(key[0], key[1])
+        _import_pil()
+        photo = ImageTk.PhotoImage(icon_pil, master=root)
+        _icon_cache.clear()
+        _icon_cache[key] = photo
+    return photo
+
+def start_detection():
+    """Detect monitors and decode images on a worker thread, then build the GUI."""
+    def detect_and_finish():
+        # Release the handles held by the previous detection pass (Restart)
+        for monitor in identified_monitors_global:
+            monitor.close()
+        detected = initialize_monitors(force_rediscover=FORCE_REDISCOVER)
+        # Resolve sources here: a cache miss means a DDC/CI read whose retries
+        # sleep, which must not happen on the Tk thread. The reads (which also
+        # resolve a lazily read model) run in parallel and overlap with the
+        # image decode below.
+        futures = {m.index: _switch_pool.submit(m.cached_source_str) for m in detected}
+        bg_pil, icon_pil = _preload_images()
+        sources = {idx: fut.result() for idx, fut in futures.items()}
+        root_window.after(0, lambda: finish_gui_setup(detected, bg_pil, icon_pil, sources))
+    threading.Thread(target=detect_and_finish, daemon=True).start()
+
+def _clear_transient_widgets(root_window):
+    """Destroy everything except the widgets created by _ensure_persistent_widgets."""
+    persistent = getattr(root_window, '_persistent_widgets', ())
     for widget in root_window.winfo_children():
-        widget.destroy()
-    
-    # Show background image if available
+        if widget not in persistent:
+            widget.destroy()
+
+def _update_background(root_window, bg_pil=None, load=True):
+    """
+    Show the background image on the persistent background label if available.
+    The loading screen passes load=False so its first paint never waits on a decode.
+    """
+    bg_label = root_window._bg_label
+    if getattr(bg_label, 'image', None):
+        return
     try:
-        bg_image_path = resource_path("background.jpg")
-        if os.path.exists(bg_image_path):
-            background_image_pil = Image.open(bg_image_path)
-            background_image_pil = background_image_pil.resize((900, 506), Image.LANCZOS)
-            bg_image_tk = ImageTk.PhotoImage(background_image_pil)
-            bg_label = tk.Label(root_window, image=bg_image_tk)
+        bg_image_tk = _get_bg_photo(root_window, bg_pil, load)
+        if bg_image_tk:
+            bg_label.config(image=bg_image_tk)
             bg_label.image = bg_image_tk
-            bg_label.place(relwidth=1, relheight=1)
-        else:
-            bg_label = tk.Label(root_window, bg="gray50")
-            bg_label.place(relwidth=1, relheight=1)
+        elif load:
+            print(f"Warning: Background image not found at {_BG_PATH}. Using gray background.")
     except Exception as e:
         print(f"Error loading background image: {e}")
-        bg_label = tk.Label(root_window, bg="gray50")
-        bg_label.place(relwidth=1, relheight=1)
+        traceback.print_exc()
 
-    loading_label = tk.Label(root_window, text="Loading...", fg="white", bg="gray20", font=('Arial', 20, 'bold'))
-    loading_label.place(relx=0.5, rely=0.5, anchor="center")
+def _ensure_persistent_widgets(root_window):
+    """
+    Create the widgets that survive a Restart (background, Exit/Restart, footer).
+    They are kept as attributes on root_window; later calls are a no-op.
+    """
+    if getattr(root_window, '_bg_label', None):
+        return
+
+    # Solid gray until _update_background swaps the image in
+    bg_label = tk.Label(root_window, bg="gray50")
+    bg_label.image = None
+    bg_label.place(relwidth=1, relheight=1)
+
+    # Make background draggable
+    dragging = False
+    x_offset = y_offset = 0
+    def start_move(event): 
+        nonlocal x_offset, y_offset, dragging
+        dragging = True
+        x_offset = event.x_root - root_window.winfo_x()
+        y_offset = event.y_root - root_window.winfo_y()
+    def on_motion(event):
+        # Coordinates come with the event; no winfo_pointerx() round-trip needed
+        if not dragging:
+            return
+        root_window.geometry(f"+{event.x_root - x_offset}+{event.y_root - y_offset}")
+    def stop_move(event): 
+        nonlocal dragging
+        dragging = False
+    
+    bg_label.bind("<ButtonPress-1>", start_move)
+    bg_label.bind("<B1-Motion>", on_motion)
+    bg_label.bind("<ButtonRelease-1>", stop_move)
 
-    # Add Exit and Restart buttons (disabled during loading)
     def exit_app():
         print("Exiting application.")
         if root_window: root_window.destroy()
+
     exit_btn = tk.Button(root_window, text="Exit", command=exit_app, fg="white", bg="red",
                         font=('Arial', 12, 'bold'), width=10, height=2, bd=0,
-                        highlightthickness=0, state=tk.DISABLED)
+                        highlightthickness=0)
     exit_btn.place(relx=0.5, y=478, anchor='s')
 
     def restart_app():
         show_loading_screen(root_window)
-        def detect_and_finish():
-            detected = initialize_monitors()
-            root_window.after(0, lambda: finish_gui_setup(detected))
-        threading.Thread(target=detect_and_finish, daemon=True).start()
+        start_detection()
+
+    # Add restart button just above the exit button, styled the same
     restart_btn = tk.Button(root_window, text="Restart", command=restart_app, fg="white", bg="red",
                            font=('Arial', 12, 'bold'), width=10, height=2, bd=0,
-                           highlightthickness=0, state=tk.DISABLED)
+                           highlightthickness=0)
     restart_btn.place(relx=0.5, y=428, anchor='s')
 
+    footer_text = f"Property of MCDIX incorporated, {time.strftime('%m.%Y')} - Gemini 2.5"
+    footer_font = ('Arial', 8)
+    footer_fg = "gray"
+    footer_bg = "gray10"
+    footer_label = tk.Label(root_window, text=footer_text, font=footer_font, fg=footer_fg, bg=footer_bg)
+    footer_label.place(x=10, rely=1.0, y=-2, anchor='sw')
+
+    root_window._bg_label = bg_label
+    root_window._exit_btn = exit_btn
+    root_window._restart_btn = restart_btn
+    root_window._footer_label = footer_label
+    root_window._persistent_widgets = (bg_label, exit_btn, restart_btn, footer_label)
+
+def show_loading_screen(root_window):
+    _clear_transient_widgets(root_window)
+    _ensure_persistent_widgets(root_window)
+    _update_background(root_window, load=False)
+
+    loading_label = tk.Label(root_window, text="Loading...", fg="white", bg="gray20", font=('Arial', 20, 'bold'))
+    loading_label.place(relx=0.5, rely=0.5, anchor="center")
+
+    # Exit and Restart stay disabled during loading
+    root_window._exit_btn.config(state=tk.DISABLED)
+    root_window._restart_btn.config(state=tk.DISABLED)
+
     return loading_label
 
-def create_monitor_control(parent_frame, monitor, monitor_image_tk, x, y, display_name=None):
-    frame = tk.Frame(parent_frame, bg="gray20", width=250, height=180)
-    frame.place(x=x, y=y)
+class MonitorControl:
+    """
+    Control frame for one monitor: name/model/source labels and the switch button.
+
+    model and source_cache let finish_gui_setup share the model string and the
+    last known source (keyed by monitor.index) for the whole render pass, so
+    re-rendering does not issue fresh DDC/CI reads.
+    """
+    __slots__ = ('monitor', 'frame', 'source_label_path', 'switch_btn', 'source_cache',
+                 '_pending_after', '_busy')
+
+    def __init__(self, parent_frame, monitor, monitor_image_tk, x, y, display_name=None,
+                 model=None, source_cache=None):
+        self.monitor = monitor
+        self._pending_after = None
+        self._busy = False
+        self.frame = frame = tk.Frame(parent_frame, bg="gray20", width=250, height=180)
+        frame.place(x=x, y=y)
+        
+        if model is None:
+            model = monitor.get_model()
+        if source_cache is None:
+            source_cache = {}
+        if monitor.index not in source_cache:
+            source_cache[monitor.index] = monitor.get_current_source_str()
+        self.source_cache = source_cache
+        
+        # Name, model and current-source labels are built by one Tcl call (see _BUILD_MON_PROC)
+        label_text = display_name if display_name else f"Monitor {monitor.index}\n{model}"
+        frame.tk.call("build_mon", str(frame), label_text, model,
+                      f"Current: {source_cache[monitor.index]}")
+        self.source_label_path = f"{frame}.source"
+        
+        # Switch button
+        btn_config = _SWITCH_BTN_BASE if not monitor_image_tk else {**_SWITCH_BTN_BASE, "image": monitor_image_tk}
+        
+        self.switch_btn = tk.Button(frame, **btn_config, command=self.on_switch)
+        switch_btn_y = 120  # Fixed Y position
+        self.switch_btn.place(x=125, y=switch_btn_y, anchor="center")
+        
+        # Add event binding for updates
+        frame.bind('<<Update>>', self.update_source_label)
     
-    # Check if this is Samsung G8 (SmartThings monitor)
-    is_samsung_g8 = "SAMSUNG" in monitor.get_model().upper()
+    def set_source_label(self, current):
+        self.source_cache[self.monitor.index] = current
+        if self.frame.winfo_exists():
+            self.frame.tk.call(self.source_label_path, "configure", "-text", f"Current: {current}")
     
-    # Monitor name/model label
-    label_text = display_name if display_name else f"Monitor {monitor.index}\n{monitor.get_model()}"
-    name_label = tk.Label(frame, text=label_text, 
-                         fg="white", bg="gray20", font=('Arial', 10, 'bold'),
-                         wraplength=220)
-    name_label.place(x=125, y=25, anchor="center")
-    # Add monitor model label under the name
-    model_label = tk.Label(frame, text=monitor.get_model(), fg="gray80", bg="gray20", font=('Arial', 9, 'italic'))
-    model_label.place(x=125, y=48, anchor="center")
+    def update_source_label(self, event=None):
+        # An explicit <<Update>> asks for the real state, not the TTL-cached one
+        if event is not None:
+            self.monitor.invalidate_source_cache()
+        # Read back on the worker pool; DDC/CI retries can take seconds
+        fut = _switch_pool.submit(self.monitor.get_current_source_str)
+        fut.add_done_callback(self._on_source_read)
     
-    # Current input source label
-    source_label = tk.Label(frame, text=f"Current: {monitor.get_current_source_str()}", 
-                           fg="white", bg="gray20", font=('Arial', 9))
-    source_label.place(x=125, y=65, anchor="center")
+    def _on_source_read(self, fut):
+        self.frame.after(0, self.set_source_label, fut.result())
     
-    # Switch button
-    btn_config = {
-        "compound": "center",
-        "fg": "white",
-        "bg": "gray20",
-        "font": ('Arial', 12, 'bold'),
-        "width": 120,
-        "height": 45,
-        "bd": 0,
-        "highlightthickness": 0,
-        "text": "Switch Input"
-    }
-    if monitor_image_tk:
-        btn_config["image"] = monitor_image_tk
+    def reset_color(self):
+        self._pending_after = None
+        if self.frame.winfo_exists():
+            self.switch_btn.config(bg="gray20")
     
-    def update_source_label():
-        current = monitor.get_current_source_str()
-        source_label.config(text=f"Current: {current}")
+    def _schedule_reset(self, delay_ms=800):
+        # Coalesce: a newer result replaces any reset still pending
+        if self._pending_after is not None:
+            self.frame.after_cancel(self._pending_after)
+        self._pending_after = self.frame.after(delay_ms, self.reset_color)
     
-    def on_switch():
+    def apply_result(self, fut):
+        self._busy = False
+        if not self.frame.winfo_exists():
+            return
         try:
-            # Always pass False (ignored by new monitor_manager anyway)
-            success, new_source = control_logic.toggle_monitor_input(monitor, offline_mode=False)
+            success, new_source = fut.result()
             if success:
-                update_source_label()
-                switch_btn.config(bg="green")
+                self.switch_btn.config(bg="green")
+                self.update_source_label()
             else:
-                switch_btn.config(bg="orange")
+                self.switch_btn.config(bg="orange")
         except Exception as e:
             print(f"Error switching input: {e}")
-            switch_btn.config(bg="red")
+            self.switch_btn.config(bg="red")
         finally:
-            frame.after(1500, lambda: switch_btn.config(bg="gray20"))
-    
-    switch_btn = tk.Button(frame, **btn_config, command=on_switch)
-    switch_btn.image = monitor_image_tk
-    switch_btn_y = 120  # Fixed Y position
-    switch_btn.place(x=125, y=switch_btn_y, anchor="center")
+            self._schedule_reset()
     
-    # Add event binding for updates
-    frame.bind('<<Update>>', lambda e: update_source_label())
+    def _on_switch_done(self, fut):
+        self.frame.after(0, self.apply_result, fut)
     
-    return frame
-
-def finish_gui_setup(monitors=None):
+    def on_switch(self):
+        # A second click while a switch is in flight is ignored rather than
+        # racing two I2C/WebSocket sequences on the same monitor. Both this and
+        # apply_result run on the Tk thread, so a plain flag is enough.
+        if self._busy:
+            return
+        self._busy = True
+        # Always pass False (ignored by new monitor_manager anyway)
+        fut = _switch_pool.submit(control_logic.toggle_monitor_input, self.monitor, offline_mode=False)
+        fut.add_done_callback(self._on_switch_done)
+
+def create_monitor_control(parent_frame, monitor, monitor_image_tk, x, y, display_name=None,
+                           model=None, source_cache=None):
+    return MonitorControl(parent_frame, monitor, monitor_image_tk, x, y, display_name,
+                          model, source_cache).frame
+
+def finish_gui_setup(monitors=None, bg_pil=None, icon_pil=None, sources=None):
     global identified_monitors_global, root_window
     if monitors is not None:
         identified_monitors_global = monitors
-    for widget in root_window.winfo_children():
-        widget.destroy()
-
-    try:
-        bg_image_path = resource_path("background.jpg")
-        if os.path.exists(bg_image_path):
-            background_image_pil = Image.open(bg_image_path)
-            background_image_pil = background_image_pil.resize((900, 506), Image.LANCZOS)
-            bg_image_tk = ImageTk.PhotoImage(background_image_pil)
-            bg_label = tk.Label(root_window, image=bg_image_tk)
-            bg_label.image = bg_image_tk
-            bg_label.place(relwidth=1, relheight=1)
-        else:
-            print(f"Warning: Background image not found at {bg_image_path}. Using gray background.")
-            bg_label = tk.Label(root_window, bg="gray50")
-            bg_label.place(relwidth=1, relheight=1)
-    except Exception as e:
-        print(f"Error loading background image: {e}")
-        traceback.print_exc()
-        bg_label = tk.Label(root_window, bg="gray50")
-        bg_label.place(relwidth=1, relheight=1)
-
-    # Make background draggable
-    dragging = False
-    x_offset = y_offset = 0
-    def start_move(event): 
-        nonlocal x_offset, y_offset, dragging
-        dragging = True
-        x_offset = event.x_root - root_window.winfo_x()
-        y_offset = event.y_root - root_window.winfo_y()
-    def on_motion(event):
-        if dragging:
-            x = event.x_root - x_offset
-            y = event.y_root - y_offset
-            root_window.geometry(f"+{x}+{y}")
-    def stop_move(event): 
-        nonlocal dragging
-        dragging = False
-    
-    bg_label.bind("<ButtonPress-1>", start_move)
-    bg_label.bind("<B1-Motion>", on_motion)
-    bg_label.bind("<ButtonRelease-1>", stop_move)
+    _clear_transient_widgets(root_window)
+    _ensure_persistent_widgets(root_window)
+    _update_background(root_window, bg_pil)
+    root_window._exit_btn.config(state=tk.NORMAL)
+    root_window._restart_btn.config(state=tk.NORMAL)
 
     monitor_image_tk = None
     try:
-        icon_filename_png = "monitor_icon.png"
-        icon_path_png = resource_path(icon_filename_png)
-        icon_filename_jpg = "monitor_icon.jpg"
-        icon_path_jpg = resource_path(icon_filename_jpg)
-        
-        actual_icon_path = None
-        loaded_filename = ""
-
-        if os.path.exists(icon_path_png):
-            actual_icon_path = icon_path_png
-            loaded_filename = icon_filename_png
-        elif os.path.exists(icon_path_jpg):
-            print(f"Info: '{icon_filename_png}' not found, using '{icon_filename_jpg}'.")
-            actual_icon_path = icon_path_jpg
-            loaded_filename = icon_filename_jpg
-
-        if actual_icon_path:
-            print(f"Loading icon: {loaded_filename}")
-            monitor_icon_original = Image.open(actual_icon_path)
-            if monitor_icon_original.mode != 'RGBA' and loaded_filename.endswith('.png'):
-                monitor_icon_original = monitor_icon_original.convert('RGBA')
-            elif monitor_icon_original.mode == 'P' and 'transparency' in monitor_icon_original.info:
-                monitor_icon_original = monitor_icon_original.convert('RGBA')
-
-            icon_size = (90, 90)
-            monitor_icon_resized = monitor_icon_original.resize(icon_size, Image.LANCZOS)
-            monitor_image_tk = ImageTk.PhotoImage(monitor_icon_resized)
-        else:
-            print(f"Warning: Monitor icon not found as '{icon_filename_png}' or '{icon_filename_jpg}'. Buttons will lack icon.")
+        monitor_image_tk = _get_icon_photo(root_window, icon_pil)
+        if monitor_image_tk is None:
+            print("Warning: Monitor icon not found as 'monitor_icon.png' or 'monitor_icon.jpg'. Buttons will lack icon.")
     except Exception as e:
         print(f"Error loading monitor icon: {e}")
         traceback.print_exc()
         monitor_image_tk = None
 
-    # Find specific monitors
-    c24g2u_monitor = None
-    samsung_g8_monitor = None
+    # Find specific monitors (single get_model() call per monitor)
+    roles = {}
     other_monitors = []
+    models = {}
+    sources = dict(sources) if sources else {}
     print("Detected monitors:")
     for monitor in identified_monitors_global:
-        print(f"  Index {monitor.index}: {monitor.get_model()}")
-        model = monitor.get_model().upper()
-        if "C24G2U" in model:
-            c24g2u_monitor = monitor
-        elif "SAMSUNG" in model: # Matched "SAMSUNG (Local)" or "SAMSUNG (SmartThings)"
-            samsung_g8_monitor = monitor
+        models[monitor.index] = monitor.get_model()
+        print(f"  Index {monitor.index}: {models[monitor.index]}")
+        model = models[monitor.index].upper()
+        role = next((name for name, keys in MONITOR_ROLES
+                     if name not in roles and all(k in model for k in keys)), None)
+        if role:
+            roles[role] = monitor
         else:
             other_monitors.append(monitor)
+    c24g2u_monitor = roles.get("c24g2u")
+    samsung_g8_monitor = roles.get("samsung_g8")
 
     # Layout constants
     window_width = 900
@@ -256,8 +559,11 @@ def finish_gui_setup(monitors=None):
                 frame.destroy()
         # Create new frames in the current order
         if len(other_monitors) >= 2:
-            left_monitor_frames[0] = create_monitor_control(root_window, other_monitors[left_monitor_order[0]], monitor_image_tk, margin_x, left1_y, display_name="Top Left")
-            left_monitor_frames[1] = create_monitor_control(root_window, other_monitors[left_monitor_order[1]], monitor_image_tk, margin_x, left2_y, display_name="Bottom Left")
+            top, bottom = other_monitors[left_monitor_order[0]], other_monitors[left_monitor_order[1]]
+            left_monitor_frames[0] = create_monitor_control(root_window, top, monitor_image_tk, margin_x, left1_y, display_name="Top Left",
+                                                            model=models[top.index], source_cache=sources)
+            left_monitor_frames[1] = create_monitor_control(root_window, bottom, monitor_image_tk, margin_x, left2_y, display_name="Bottom Left",
+                                                            model=models[bottom.index], source_cache=sources)
 
     def swap_left_buttons():
         if len(left_monitor_order) == 2:
@@ -275,43 +581,22 @@ def finish_gui_setup(monitors=None):
     if c24g2u_monitor:
         c24g2u_x = window_width - control_width - margin_x
         c24g2u_y = margin_y
-        create_monitor_control(root_window, c24g2u_monitor, monitor_image_tk, c24g2u_x, c24g2u_y, display_name="Top Right")
+        create_monitor_control(root_window, c24g2u_monitor, monitor_image_tk, c24g2u_x, c24g2u_y, display_name="Top Right",
+                               model=models[c24g2u_monitor.index], source_cache=sources)
 
     # Samsung G8 bottom right
     if samsung_g8_monitor:
         samsung_g8_x = window_width - control_width - margin_x
         samsung_g8_y = window_height - control_height - margin_y
-        create_monitor_control(root_window, samsung_g8_monitor, monitor_image_tk, samsung_g8_x, samsung_g8_y, display_name="Bottom Right")
-
-    def exit_app():
-        print("Exiting application.")
-        if root_window: root_window.destroy()
-
-    exit_btn = tk.Button(root_window, text="Exit", command=exit_app, fg="white", bg="red",
-                        font=('Arial', 12, 'bold'), width=10, height=2, bd=0,
-                        highlightthickness=0)
-    exit_btn.place(relx=0.5, y=478, anchor='s')
-
-    def restart_app():
-        show_loading_screen(root_window)
-        def detect_and_finish():
-            detected = initialize_monitors()
-            root_window.after(0, lambda: finish_gui_setup(detected))
-        threading.Thread(target=detect_and_finish, daemon=True).start()
-
-    # Add restart button just above the exit button, styled the same
-    restart_btn = tk.Button(root_window, text="Restart", command=restart_app, fg="white", bg="red",
-                           font=('Arial', 12, 'bold'), width=10, height=2, bd=0,
-                           highlightthickness=0)
-    restart_btn.place(relx=0.5, y=428, anchor='s')
+        create_monitor_control(root_window, samsung_g8_monitor, monitor_image_tk, samsung_g8_x, samsung_g8_y, display_name="Bottom Right",
+                               model=models[samsung_g8_monitor.index], source_cache=sources)
 
-    footer_text = f"Property of MCDIX incorporated, {time.strftime('%m.%Y')} - Gemini 2.5"
-    footer_font = ('Arial', 8)
-    footer_fg = "gray"
-    footer_bg = "gray10"
-    footer_label = tk.Label(root_window, text=footer_text, font=footer_font, fg=footer_fg, bg=footer_bg)
-    footer_label.place(x=10, rely=1.0, y=-2, anchor='sw')
+    # Flush the geometry/redraw work of the whole rebuild in one pass, then
+    # raise the window once the idle queue has drained.
+    root_window.update_idletasks()
+    root_window.after_idle(_raise_window)
 
+def _raise_window():
     root_window.lift()
     root_window.attributes("-topmost", True)
     root_window.after_idle(root_window.attributes, '-topmost', False)
@@ -327,16 +612,20 @@ def create_gui():
         root_window.minsize(900, 506)
         root_window.maxsize(900, 506)
         root_window.configure(bg="#1a1a1a")
+        root_window.tk.eval(_BUILD_MON_PROC)
         
-        # Set window and taskbar icon
-        try:
-            icon_path = resource_path('dark_icon.png')
-            if os.path.exists(icon_path):
-                icon_image = Image.open(icon_path)
-                icon_photo = ImageTk.PhotoImage(icon_image)
-                root_window.iconphoto(True, icon_photo)
-        except Exception as e:
-            print(f"Could not set window icon: {e}")
+        # Set window and taskbar icon once the loading screen is up. Tk 8.6
+        # decodes PNG itself, so this doesn't pull Pillow onto the Tk thread.
+        def set_window_icon():
+            try:
+                icon_path = resource_path('dark_icon.png')
+                if os.path.exists(icon_path):
+                    icon_photo = tk.PhotoImage(file=icon_path, master=root_window)
+                    root_window.iconphoto(True, icon_photo)
+            except Exception as e:
+                print(f"Could not set window icon: {e}")
+        
+        root_window.after(100, set_window_icon)
         
         # Apply dark title bar after window is visible
         def apply_dark_titlebar():
@@ -353,14 +642,14 @@ def create_gui():
 
     show_loading_screen(root_window)
 
-    # Remove drag bindings from the root window
-    # Only the background label will be draggable (handled in show_loading_screen and finish_gui_setup)
+    # Only the background label is draggable (bound in _ensure_persistent_widgets)
 
-    def detect_and_finish():
-        detected = initialize_monitors()
-        root_window.after(0, lambda: finish_gui_setup(detected))
-    threading.Thread(target=detect_and_finish, daemon=True).start()
+    start_detection()
 
 if __name__ == "__main__":
+    FORCE_REDISCOVER = "--force-rediscover" in sys.argv[1:]
+    # MONITOR_SWITCH_DEBUG=1 turns on the [DEBUG] source-read logging
+    if os.environ.get("MONITOR_SWITCH_DEBUG"):
+        logging.basicConfig(level=logging.DEBUG, format='[%(levelname)s] %(message)s')
     create_gui()
     root_window.mainloop()
\ No newline at end of file
@@ -1,5 +1,30 @@
 import time
 
+from monitor_manager import normalize_source
+
+# Upper bound on how long a monitor may take to stabilize after an input
+# switch. toggle_monitor_input polls the source and returns as soon as the
+# monitor reports the new input, so this is only paid on a slow/silent monitor.
+SETTLE_MS = 2000
+SETTLE_POLL_S = 0.1
+
+# Exact source strings reported by monitorcontrol / MyMonitor.VCP_INPUT_CODES
+_HDMI_SOURCES = frozenset({"HDMI1", "HDMI2", "HDMI 1", "HDMI 2", "HDMI-1", "HDMI-2", "HDMI"})
+
+def wait_for_source(monitor, new_source, timeout_ms=SETTLE_MS):
+    """
+    Poll the monitor until it reports new_source or timeout_ms elapses.
+    
+    Returns: bool - True if the monitor confirmed the new source
+    """
+    target = normalize_source(new_source)
+    deadline = time.monotonic() + timeout_ms / 1000
+    while time.monotonic() < deadline:
+        if normalize_source(monitor.get_current_source_str(max_age=0)) == target:
+            return True
+        time.sleep(SETTLE_POLL_S)
+    return False
+
 def toggle_monitor_input(monitor, offline_mode=False):
     """
     Toggle a monitor's input between DP1 and HDMI1.
@@ -9,18 +34,20 @@ def toggle_monitor_input(monitor, offline_mode=False):
         offline_mode: If True, use local WebSocket control (for Samsung G8)
     
     Returns: (bool, str) - (success, new_source)
+
+    Blocks on monitor I/O, so call it from a worker thread rather than the Tk loop.
     """
     print(f"Action: Toggle input for monitor {monitor.index} ({monitor.get_model()})")
     if offline_mode:
         print("  Using OFFLINE mode (local WebSocket)")
     
+    # Reuses a read/switch younger than SOURCE_CACHE_TTL (saves a DDC/CI read),
+    # but reads live once it's older: the input may have been changed from the
+    # monitor's OSD or a KVM since, and toggling from a stale value is a no-op
     current_source = str(monitor.get_current_source_str())
     
-    # Normalize for robust comparison (handle "HDMI 1" vs "HDMI1")
-    src_upper = current_source.upper().replace(" ", "").replace("-", "")
-    
-    # Determine Target
-    if "HDMI" in src_upper:
+    # Determine Target (set lookup first, normalize only for unusual names)
+    if current_source in _HDMI_SOURCES or "HDMI" in normalize_source(current_source):
         # Switch to DP
         # InputSource.DP1 = 15. "DP1" is the correct attribute name for monitorcontrol.
         new_source = "DP1"
@@ -31,10 +58,12 @@ def toggle_monitor_input(monitor, offline_mode=False):
             
     print(f"  Analysis: Current='{current_source}' -> New='{new_source}'")
     
-    success = monitor.set_input_source(new_source, offline_mode=offline_mode)
-    if not success:
+    # May differ from new_source when a newer queued toggle ran in its place
+    applied = monitor.set_input_source(new_source, offline_mode=offline_mode)
+    if not applied:
         raise RuntimeError(f"Monitor {monitor.index} failed to switch to {new_source}")
     
-    # Add delay to allow monitor to stabilize after input switch
-    time.sleep(2)
-    return success, new_source
\ No newline at end of file
+    # Wait for the monitor to stabilize, but only as long as it takes to confirm
+    if not wait_for_source(monitor, applied):
+        print(f"  Monitor {monitor.index} did not confirm '{applied}' within {SETTLE_MS} ms")
+    return True, applied
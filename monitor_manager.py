@@ -1,9 +1,154 @@
-from monitorcontrol import get_monitors
-import traceback
+from monitorcontrol import get_monitors, InputSource
 import sys
-from samsung_tizen_controller import SamsungTizenController
+import asyncio
+import logging
+import atexit
 import json
 import os
+import functools
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+_log = logging.getLogger(__name__)
+
+APP_DATA_DIR = os.path.join(os.environ.get('APPDATA', '.'), 'MonitorInputSwitch')
+try:
+    os.makedirs(APP_DATA_DIR, exist_ok=True)
+except OSError:
+    # Read-only/sandboxed profile: the caches and token just won't persist
+    pass
+# Same path setup_local_auth.py pairs into
+TIZEN_TOKEN_FILE = os.path.join(APP_DATA_DIR, "samsung_g8_token.txt")
+
+# A pairing younger than this is trusted without the REST device-info probe;
+# initialize_monitors(force_rediscover=True) probes anyway
+TIZEN_PAIRING_TRUST = 24 * 3600  # seconds
+
+# How long a live input-source read is reused before the bus is queried again
+SOURCE_CACHE_TTL = 3.0  # seconds
+
+# Removes separators in one C-level pass ("HDMI 1" / "HDMI-1" -> "HDMI1")
+_NORM = str.maketrans("", "", " -")
+
+def normalize_source(source):
+    """Map "HDMI 1" / "HDMI-1" / "DisplayPort 1" style names onto "HDMI1" / "DP1"."""
+    s = str(source).upper().translate(_NORM)
+    return s.replace("DISPLAYPORT", "DP")
+
+# Resolved once here so monitorcontrol doesn't do the InputSource[name]
+# lookup on every switch. Other names still go through as strings.
+_SOURCE_MAP = {
+    "DP1": InputSource.DP1,
+    "HDMI1": InputSource.HDMI1,
+}
+
+# Model strings from get_vcp_capabilities(), persisted across runs because the
+# capabilities read is by far the slowest DDC/CI call at startup.
+VCP_CACHE_FILE = os.path.join(APP_DATA_DIR, 'vcp_cache.json')
+VCP_CACHE_MAX_AGE = 30 * 24 * 3600  # seconds
+_vcp_cache = {}
+# Identities of all enumerated monitors, in order, that _vcp_cache belongs to
+_vcp_signature = []
+_vcp_cache_dirty = False
+_vcp_cache_lock = threading.Lock()
+# Serializes writers of the shared .tmp file (models may be read on several threads)
+_vcp_save_lock = threading.Lock()
+
+# local_config.json (written by setup_local_auth.py), parsed again only when
+# its mtime changes, so re-pairing and then Restart picks up the new values
+LOCAL_CONFIG_FILE = "local_config.json"
+_local_config = None
+_local_config_mtime = None
+_local_config_lock = threading.Lock()
+
+def _load_local_config():
+    try:
+        with open(LOCAL_CONFIG_FILE, 'r') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+    except OSError as e:
+        print(f"Warning: Could not read local_config.json: {e}")
+        return {}
+
+def _get_local_config():
+    global _local_config, _local_config_mtime
+    try:
+        mtime_ns = os.stat(LOCAL_CONFIG_FILE).st_mtime_ns
+    except OSError:
+        mtime_ns = None
+    with _local_config_lock:
+        if _local_config is None or mtime_ns != _local_config_mtime:
+            _local_config = _load_local_config()
+            _local_config_mtime = mtime_ns
+        return _local_config
+
+def _vcp_ident(monitor_obj):
+    # Windows exposes the physical monitor description, Linux the I2C bus number
+    vcp = getattr(monitor_obj, 'vcp', None)
+    return str(getattr(vcp, 'description', None) or getattr(vcp, 'bus_number', None))
+
+def _vcp_cache_key(index, monitor_obj):
+    return f"{index}:{_vcp_ident(monitor_obj)}"
+
+def _load_vcp_cache(signature):
+    """
+    Load the model cache for this enumeration. monitorcontrol has no stable
+    per-monitor identity (Windows descriptions are mostly "Generic PnP
+    Monitor"), so the whole cache is dropped whenever the signature (count
+    and order of the identities) differs from the one it was saved with.
+    """
+    global _vcp_cache, _vcp_signature, _vcp_cache_dirty
+    data = {}
+    try:
+        with open(VCP_CACHE_FILE, 'r') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        pass
+    models = {}
+    if isinstance(data, dict) and data.get('signature') == signature:
+        models = data.get('models')
+    if not isinstance(models, dict):
+        models = {}
+    now = time.time()
+    with _vcp_cache_lock:
+        _vcp_signature = list(signature)
+        _vcp_cache = {k: v for k, v in models.items()
+                      if isinstance(v, dict) and now - v.get('ts', 0) < VCP_CACHE_MAX_AGE}
+        _vcp_cache_dirty = False
+
+def _save_vcp_cache():
+    global _vcp_cache_dirty
+    with _vcp_save_lock:
+        with _vcp_cache_lock:
+            if not _vcp_cache_dirty:
+                return
+            data = {'signature': _vcp_signature, 'models': dict(_vcp_cache)}
+            _vcp_cache_dirty = False
+        try:
+            os.makedirs(APP_DATA_DIR, exist_ok=True)
+            tmp = VCP_CACHE_FILE + '.tmp'
+            with open(tmp, 'w') as f:
+                json.dump(data, f, indent=4)
+            os.replace(tmp, VCP_CACHE_FILE)
+        except OSError as e:
+            print(f"Warning: Could not save VCP cache: {e}")
+
+def _get_cached_model(key):
+    with _vcp_cache_lock:
+        entry = _vcp_cache.get(key)
+    return entry.get('model') if entry else None
+
+def _store_cached_model(key, model):
+    global _vcp_cache_dirty
+    if not model or model == 'N/A':
+        return
+    with _vcp_cache_lock:
+        _vcp_cache[key] = {'model': model, 'ts': time.time()}
+        _vcp_cache_dirty = True
 
 class MyMonitor:
     VCP_INPUT_CODES = {
@@ -18,19 +163,47 @@ class MyMonitor:
         12: "VGA 1" # Sometimes
     }
 
-    def __init__(self, index, monitor_obj, is_tizen=False):
+    def __init__(self, index, monitor_obj, is_tizen=False, force_rediscover=False):
         self.index = index
         self.monitor = monitor_obj
         self.vcp = {}
-        self.model = "N/A"
+        self.model = "N/A"  # also sets _is_ed32qur (see the model property)
         self.current_source = "Unknown"
         self.software_source = None
+        # True once current_source comes from a live read or a successful switch
+        self._source_fresh = False
+        # monotonic time of the last live read; 0 forces the next read
+        self._src_cache_ts = 0.0
+        # monotonic time of the last successful VCP write
+        self._src_write_ts = 0.0
+        self._src_cache_ttl = SOURCE_CACHE_TTL
         self.error = None
         self.is_tizen = is_tizen
         self.tizen_controller = None
+        # Serializes access to this monitor's VCP handle / Tizen socket when
+        # switches for several monitors run on worker threads.
+        self._lock = threading.RLock()
+        # Serializes Tizen connects. Kept apart from _lock so close() never
+        # waits out a handshake to an unreachable monitor.
+        self._connect_lock = threading.Lock()
+        # Set by close(); a connect that finishes afterwards drops its socket.
+        # _connecting tells close() a handshake is in flight and will do so.
+        # Both are guarded by _close_lock.
+        self._closed = False
+        self._connecting = False
+        self._close_lock = threading.Lock()
+        # Depth of nested _vcp_session() blocks; only the outermost opens the handle
+        self._handle_ref_count = 0
+        self._persistent_handle = False
+        # Latest target requested by set_input_source, consumed under _lock;
+        # swapped under _pending_lock since requests set it before taking _lock
+        self._pending_target = None
+        self._pending_lock = threading.Lock()
+        # Source the last switch applied (None if it failed), for requests it consumed
+        self._last_applied = None
         
         # Load Local Config (Tizen)
-        self.local_config = self._load_local_config()
+        self.local_config = _get_local_config()
 
         # If this is the Tizen Monitor (Samsung G8)
         if self.is_tizen:
@@ -40,21 +213,29 @@ class MyMonitor:
             if monitor_ip:
                 print(f"[Monitor {self.index}] Initializing Local Tizen Control at {monitor_ip}")
                 
-                # Setup Token Path
-                app_data_dir = os.path.join(os.environ.get('APPDATA', '.'), 'MonitorInputSwitch')
-                os.makedirs(app_data_dir, exist_ok=True)
-                token_file = os.path.join(app_data_dir, "samsung_g8_token.txt")
-                
                 # Initialize Controller (Disconnected initially)
                 # Default source assumption: DP1
                 self.current_source = "DisplayPort 1"
                 
+                # Imported here: samsungtvws pulls in websocket/ssl/requests,
+                # which a setup without a Tizen monitor never needs
+                from samsung_tizen_controller import SamsungTizenController
+
                 # Initialize controller with default state
                 self.tizen_controller = SamsungTizenController(
                     monitor_ip, 
-                    token_file=token_file, 
-                    initial_state=self.current_source
+                    token_file=TIZEN_TOKEN_FILE, 
+                    initial_state=self.current_source,
+                    # The macro's OSD waits are fixed guesses; let a faster
+                    # monitor shorten them from local_config.json
+                    settle_scale=float(self.local_config.get("osd_settle_scale", 1.0)),
+                    device_name=None if force_rediscover else self._trusted_device_name()
                 )
+                # Connect in the background so the first switch doesn't pay the
+                # handshake. _ensure_tizen_connection holds _connect_lock, so a
+                # switch issued meanwhile waits for this connect instead of starting another.
+                threading.Thread(target=self._ensure_tizen_connection, daemon=True).start()
+                atexit.register(self.close)
                 
             else:
                 print(f"[Monitor {self.index}] Tizen control enabled but no IP configured.")
@@ -62,44 +243,191 @@ class MyMonitor:
             return
         
         # Normal VCP initialization for standard monitors
+        self._cache_key = _vcp_cache_key(self.index, self.monitor)
+        cached_model = _get_cached_model(self._cache_key)
+        if cached_model and self._looks_like_ed32qur(cached_model):
+            # The ED32QUR workaround replaces bus reads with software_source;
+            # only a live capabilities read may turn it on
+            cached_model = None
+        if cached_model:
+            # Warm start: the slow capabilities string read is never needed
+            self.model = cached_model
+            self.vcp = {'model': cached_model}
+        else:
+            # Cold start: read capabilities on the first get_model() call
+            self.model = None
         try:
-            with self.monitor:
-                self.vcp = self.monitor.get_vcp_capabilities()
-                self.model = self.vcp.get('model', 'N/A')
-                source_obj = self.monitor.get_input_source()
-                # print(f"[DEBUG] Monitor {self.index} ({self.model}) get_input_source() raw: {repr(source_obj)}")
-                
-                # Handle raw int codes or Enum members
-                if isinstance(source_obj, int):
-                    self.current_source = self.VCP_INPUT_CODES.get(source_obj, str(source_obj))
-                elif hasattr(source_obj, 'name'):
-                    self.current_source = source_obj.name
-                else:
-                    self.current_source = str(source_obj)
-                
-                # If this is the buggy model, initialize software_source
-                if self.is_ed32qur():
-                    self.software_source = self.current_source
+            # Keep the handle open for the lifetime of this object so later reads
+            # and switches don't pay the open/close on every operation.
+            # The input source is read lazily by the first
+            # get_current_source_str(), keeping one DDC/CI round-trip per
+            # monitor off the detection path.
+            self._open_persistent_handle()
         except Exception as e:
             self.error = e
+            self.model = self.model or "N/A"
             print(f"Error initializing Monitor Index {self.index}: {type(e).__name__}: {e}")
+            self.close()
 
-    def _load_local_config(self):
+    def _trusted_device_name(self):
+        """Device name from a recent setup_local_auth.py pairing, else None."""
+        if not os.path.exists(TIZEN_TOKEN_FILE):
+            return None
         try:
-            if os.path.exists("local_config.json"):
-                with open("local_config.json", 'r') as f:
-                    return json.load(f)
-        except:
-            pass
-        return {}
+            age = time.time() - float(self.local_config.get("token_ts", 0))
+        except (TypeError, ValueError):
+            return None
+        if 0 <= age < TIZEN_PAIRING_TRUST:
+            return self.local_config.get("device_name")
+        return None
+
+    @property
+    def model(self):
+        return self._model
+
+    @model.setter
+    def model(self, value):
+        # Classify the model once per assignment instead of on every is_ed32qur() call
+        self._model = value
+        self._is_ed32qur = self._looks_like_ed32qur(value)
+
+    @staticmethod
+    def _looks_like_ed32qur(model):
+        m = str(model).upper()
+        return "ED32" in m and "QUR" in m
+
+    def _open_persistent_handle(self):
+        with self._lock:
+            if self._persistent_handle:
+                return
+            if self._handle_ref_count == 0:
+                self.monitor.__enter__()
+            self._handle_ref_count += 1
+            self._persistent_handle = True
+        atexit.register(self.close)
+
+    def _ensure_tizen_connection(self):
+        """
+        Connect the Tizen controller unless it already holds a live connection.
+        The socket is kept open between switches to skip the REST/WebSocket handshake.
+        """
+        with self._connect_lock:
+            with self._close_lock:
+                if self._closed:
+                    return False
+                self._connecting = True
+            try:
+                connected = self.tizen_controller.ensure_connected()
+            finally:
+                with self._close_lock:
+                    self._connecting = False
+                    closed = self._closed
+            if closed:
+                # close() ran during the handshake; don't leak the socket/keepalive
+                self.tizen_controller.disconnect()
+                return False
+            return connected
+
+    def close(self):
+        """Release the persistent VCP handle / Tizen connection (also registered with atexit)."""
+        if self.tizen_controller:
+            # Don't wait for a connect in flight: it may take up to its 30 s
+            # timeout, and it disconnects by itself once it sees _closed
+            with self._close_lock:
+                self._closed = True
+                connecting = self._connecting
+            if not connecting:
+                self.tizen_controller.disconnect()
+            atexit.unregister(self.close)
+            return
+        with self._lock:
+            if not self._persistent_handle:
+                return
+            self._persistent_handle = False
+            self._handle_ref_count -= 1
+            if self._handle_ref_count == 0:
+                try:
+                    self.monitor.__exit__(None, None, None)
+                except Exception as e:
+                    print(f"Warning: Could not close Monitor {self.index}: {e}")
+        atexit.unregister(self.close)
+
+    def reopen(self):
+        """Re-acquire the VCP handle, e.g. after the monitor was unplugged/replugged."""
+        if self.is_tizen or self.error:
+            return
+        with self._lock:
+            self.close()
+            try:
+                self._open_persistent_handle()
+            except Exception as e:
+                print(f"Warning: Could not reopen Monitor {self.index}: {e}")
+
+    @contextmanager
+    def _vcp_session(self):
+        """
+        Lock the monitor and open its VCP handle. Nested sessions reuse the
+        already open handle instead of re-entering monitorcontrol's context
+        (which on Linux would reopen the I2C device and close it early).
+        """
+        with self._lock:
+            if self._handle_ref_count == 0:
+                self.monitor.__enter__()
+            self._handle_ref_count += 1
+            try:
+                yield self.monitor
+            finally:
+                self._handle_ref_count -= 1
+                if self._handle_ref_count == 0:
+                    self.monitor.__exit__(None, None, None)
+
+    @staticmethod
+    def _source_to_str(source_obj):
+        # Handle raw int codes or Enum members
+        if isinstance(source_obj, int):
+            # Explicit miss check: don't build the str() default on a hit
+            s = _CODES.get(source_obj)
+            return s if s is not None else str(source_obj)
+        if hasattr(source_obj, 'name'):
+            return source_obj.name
+        return str(source_obj)
 
     def is_ed32qur(self):
-        return "ED32" in self.model.upper() and "QUR" in self.model.upper()
+        if not self.is_tizen:
+            self.get_model()
+        return self._is_ed32qur
 
     def get_model(self):
+        """The model name, reading the VCP capabilities string on first use."""
+        if self.model is None:
+            self._fetch_model()
         return self.model
 
-    def get_current_source_str(self):
+    def _fetch_model(self):
+        with self._lock:
+            if self.model is not None:
+                return
+            try:
+                with self._vcp_session():
+                    self.vcp = self.monitor.get_vcp_capabilities()
+                model = self.vcp.get('model', 'N/A')
+            except Exception as e:
+                print(f"Warning: Could not read capabilities of Monitor {self.index}: {e}")
+                model = 'N/A'
+            self.model = model
+        # Persist right away: with lazy reads this runs after initialize_monitors' save
+        _store_cached_model(self._cache_key, model)
+        _save_vcp_cache()
+
+    def invalidate_source_cache(self):
+        """Make the next get_current_source_str() query the monitor."""
+        self._src_cache_ts = 0.0
+
+    def get_current_source_str(self, max_age=None):
+        """
+        Current input source. A live read younger than max_age seconds
+        (default SOURCE_CACHE_TTL) is reused; pass max_age=0 to force a read.
+        """
         # Tizen Monitor: Return tracked state
         if self.is_tizen:
              if self.tizen_controller:
@@ -111,97 +439,224 @@ class MyMonitor:
 
         if self.error: 
             return "Error"
-        if self.is_ed32qur() and self.software_source:
+        self.get_model()  # _is_ed32qur depends on the (lazily read) model
+        if self._is_ed32qur and self.software_source:
              return self.software_source
+        if max_age is None:
+            max_age = self._src_cache_ttl
+        if self._source_fresh and time.monotonic() - self._src_cache_ts < max_age:
+            return self.current_source
         
         max_retries = 3
         for attempt in range(max_retries):
             try:
-                with self.monitor:
+                with self._vcp_session():
                     source_obj = self.monitor.get_input_source()
-                    
-                    if isinstance(source_obj, int):
-                         self.current_source = self.VCP_INPUT_CODES.get(source_obj, str(source_obj))
-                    elif hasattr(source_obj, 'name'):
-                         self.current_source = source_obj.name
-                    else:
-                         self.current_source = str(source_obj)
+                    # %-style args: nothing is formatted unless DEBUG logging is enabled
+                    _log.debug("Monitor %s (%s) get_input_source() raw: %r", self.index, self.model, source_obj)
+                    self.current_source = self._source_to_str(source_obj)
+                    self._source_fresh = True
+                    self._src_cache_ts = time.monotonic()
+                    # If this is the buggy model, seed software_source from the first read
+                    if self._is_ed32qur and not self.software_source:
+                        self.software_source = self.current_source
                          
                     return self.current_source
             except Exception as e:
                 if attempt < max_retries - 1:
-                    import time
-                    time.sleep(1)
+                    # The OS handle may have gone stale; reopen before retrying
+                    self.reopen()
+                    # Exponential backoff with jitter: ~50 ms, ~150 ms
+                    time.sleep(0.05 * (3 ** attempt) + random.uniform(0, 0.02))
                     continue
                 return "Unknown (Error checking)"
 
-    def set_input_source(self, desired_source_str, offline_mode=False):
-        # Tizen Control
+    def cached_source_str(self, read=True):
+        """
+        Last known source without touching the DDC/CI bus. Falls back to a live
+        get_current_source_str() until the source has been read or set once;
+        with read=False it returns None instead.
+        """
+        if self.is_tizen or self.error:
+            return self.get_current_source_str()
+        if not self._source_fresh:
+            return self.get_current_source_str() if read else None
+        return self.software_source or self.current_source
+
+    def set_input_source(self, desired_source_str, offline_mode=False, force=False):
+        """
+        Switch to desired_source_str. Skips the write if the monitor is already
+        on that input; pass force=True to write it anyway (e.g. after a wake,
+        when the physical state may have drifted).
+
+        Returns: str or None - the source actually applied, or None on failure.
+        This differs from desired_source_str when a newer queued request ran
+        in its place.
+        """
+        # Coalesce: requests queued behind a running switch collapse into the
+        # latest one, so rapid clicks cost one switch instead of one each.
+        with self._pending_lock:
+            self._pending_target = desired_source_str
+        with self._lock:
+            with self._pending_lock:
+                target, self._pending_target = self._pending_target, None
+            if target is None:
+                # A switch that started after this request was queued already
+                # took its target (or a newer one); report what that applied
+                applied = self._last_applied
+                if applied is not None and applied != desired_source_str:
+                    print(f"Monitor {self.index}: '{desired_source_str}' superseded by '{applied}'.")
+                return applied
+            if target != desired_source_str:
+                print(f"Monitor {self.index}: '{desired_source_str}' superseded by '{target}'.")
+            if not force and self._is_on_source(target):
+                print(f"Monitor {self.index} already on '{target}'.")
+                success = True
+            elif self.is_tizen and self.tizen_controller:
+                # Tizen Control
+                success = self._set_tizen_source(target, force)
+            else:
+                # Standard VCP Control
+                success = self._set_vcp_source(target)
+            self._last_applied = target if success else None
+            return self._last_applied
+
+    async def set_input_source_async(self, desired_source_str, force=False):
+        """
+        Awaitable set_input_source for callers that run an asyncio loop; several
+        monitors can then be switched concurrently with asyncio.gather().
+
+        Runs set_input_source on the loop's default executor, so it shares the
+        monitor's locks and switch coalescing with the GUI's switches and
+        never interleaves keys with a macro already in flight. (samsungtvws'
+        async client would also need the extra 'websockets' package.)
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, functools.partial(self.set_input_source, desired_source_str, force=force))
+
+    def _is_on_source(self, source):
+        if self.error:
+            return False
+        want = normalize_source(source)
         if self.is_tizen and self.tizen_controller:
-            print(f"Setting Tizen Monitor {self.index} to '{desired_source_str}'...")
-            try:
-                # Update controller's knowledge of current state before action
-                # We update the controller state with what we THINK is current, if needed.
-                # Actually, the controller maintains state.
-                
-                if self.tizen_controller.connect():
-                    success = self.tizen_controller.set_input_source(desired_source_str)
-                    self.tizen_controller.disconnect()
-                    if success:
-                        self.current_source = desired_source_str
-                        print(f"Tizen Monitor {self.index} switched successfully.")
-                    return success
-                else:
+            return normalize_source(self.tizen_controller.current_app_state) == want
+        # Trust the last read/write only for the cache TTL: the input may have
+        # been changed from the monitor's own OSD since
+        last = max(self._src_cache_ts, self._src_write_ts)
+        if not self._source_fresh or time.monotonic() - last >= self._src_cache_ttl:
+            return False
+        return normalize_source(self.software_source or self.current_source) == want
+
+    def _set_tizen_source(self, desired_source_str, force=False):
+        print(f"Setting Tizen Monitor {self.index} to '{desired_source_str}'...")
+        try:
+            # The controller maintains its own source state.
+            with self._lock:
+                if not self._ensure_tizen_connection():
                     print("Failed to connect to Tizen monitor.")
                     return False
-            except Exception as e:
-                print(f"Error controlling Tizen monitor: {e}")
-                traceback.print_exc()
-                return False
-        
-        # Standard VCP Control
-        return self._set_vcp_source(desired_source_str)
+                success = self.tizen_controller.set_input_source(desired_source_str, force=force)
+                if not success:
+                    # The monitor may have dropped the idle socket; retry once
+                    # on a fresh connection.
+                    self.tizen_controller.disconnect()
+                    if self._ensure_tizen_connection():
+                        success = self.tizen_controller.set_input_source(desired_source_str, force=force)
+            if success:
+                self.current_source = desired_source_str
+                self.invalidate_source_cache()
+                print(f"Tizen Monitor {self.index} switched successfully.")
+            return success
+        except Exception as e:
+            print(f"Error controlling Tizen monitor: {e}")
+            # Full traceback only with DEBUG logging (MONITOR_SWITCH_DEBUG)
+            _log.debug("Tizen Monitor %s switch failed", self.index, exc_info=True)
+            # Don't keep a socket in an unknown state; the next switch reconnects
+            with self._lock:
+                self.tizen_controller.disconnect()
+            return False
 
     def _set_vcp_source(self, desired_source_str):
         if self.error:
             print(f"Monitor {self.index} has error state.")
             return False
+        self.get_model()  # _is_ed32qur depends on the (lazily read) model
             
         try:
-            with self.monitor:
+            with self._vcp_session():
                 print(f"Setting Monitor {self.index} ({self.model}) to '{desired_source_str}' via VCP...")
-                self.monitor.set_input_source(desired_source_str)
+                self.monitor.set_input_source(_SOURCE_MAP.get(desired_source_str, desired_source_str))
                 self.current_source = desired_source_str
-                if self.is_ed32qur():
+                self._source_fresh = True
+                self._src_write_ts = time.monotonic()
+                # The monitor may not report the new input yet; read it again next time
+                self.invalidate_source_cache()
+                if self._is_ed32qur:
                     self.software_source = desired_source_str
                 return True
         except Exception as e:
             print(f"VCP Error Monitor {self.index}: {e}")
-            traceback.print_exc()
+            _log.debug("Monitor %s VCP write failed", self.index, exc_info=True)
+            self.reopen()
             return False
 
-def initialize_monitors():
+# Module-level alias: skips the class attribute lookup on every source read
+_CODES = MyMonitor.VCP_INPUT_CODES
+
+def _build_monitor_from_handle(index, monitor_obj, force_rediscover=False):
+    # Configure Index 3 as the Tizen/Samsung Monitor
+    is_tizen = (index == 3)
+    return MyMonitor(index, monitor_obj, is_tizen=is_tizen, force_rediscover=force_rediscover)
+
+def initialize_monitors(parallel=True, force_rediscover=False):
+    """
+    Detect monitors and wrap each one in a MyMonitor.
+
+    With parallel=True every monitor is probed on its own thread; the DDC/CI
+    calls release the GIL, so detection takes about as long as the slowest
+    monitor instead of the sum of all of them.
+
+    force_rediscover=True makes the Tizen monitor run the REST device-info
+    probe even if setup_local_auth.py paired it recently.
+    """
     print("--- Detecting Monitors ---")
     identified_monitors_list = []
     monitor_handles = get_monitors()
+    _load_vcp_cache([_vcp_ident(m) for m in monitor_handles])
 
     if not monitor_handles:
         print("!!! No monitors detected.")
     else:
-        for i, monitor_obj in enumerate(monitor_handles):
-            print(f"\nProcessing Monitor Index: {i}")
-            
-            # Configure Index 3 as the Tizen/Samsung Monitor
-            is_tizen = (i == 3)
-            
-            mon = MyMonitor(i, monitor_obj, is_tizen=is_tizen)
-            identified_monitors_list.append(mon)
-            
-            print(f"  Index: {mon.index}")
-            print(f"  Model: {mon.get_model()}")
-            print(f"  Source: {mon.get_current_source_str()}")
+        if parallel and len(monitor_handles) > 1:
+            with ThreadPoolExecutor(max_workers=min(8, len(monitor_handles))) as ex:
+                futures = [ex.submit(_build_monitor_from_handle, i, m, force_rediscover)
+                           for i, m in enumerate(monitor_handles)]
+            # Collect in index order; one monitor blowing up must not drop the others
+            for i, fut in enumerate(futures):
+                try:
+                    identified_monitors_list.append(fut.result())
+                except Exception as e:
+                    print(f"Error initializing Monitor Index {i}: {type(e).__name__}: {e}")
+        else:
+            identified_monitors_list = [_build_monitor_from_handle(i, m, force_rediscover)
+                                        for i, m in enumerate(monitor_handles)]
+        _save_vcp_cache()
+
+    # Build the report and write it once; each print() is a separate
+    # (synchronous, on Windows) console write.
+    lines = []
+    for mon in identified_monitors_list:
+        lines.append(f"\nProcessing Monitor Index: {mon.index}")
+        lines.append(f"  Index: {mon.index}")
+        # Don't force a lazy capabilities read just to print it
+        lines.append(f"  Model: {mon.model if mon.model is not None else 'not read yet'}")
+        # The source is read lazily (in parallel by the UI); don't block on it here
+        lines.append(f"  Source: {mon.cached_source_str(read=False) or 'not read yet'}")
 
-    print("\n--- Monitor Detection Complete ---")
-    print(f"Found {len(identified_monitors_list)} monitor(s).")
-    print("-" * 30 + "\n")
+    lines.append("\n--- Monitor Detection Complete ---")
+    lines.append(f"Found {len(identified_monitors_list)} monitor(s).")
+    lines.append("-" * 30 + "\n")
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
     return identified_monitors_list
@@ -1,10 +1,83 @@
 import subprocess
 import sys
 import os
-import tempfile # Required for temporary files
+import io
+import hashlib
+import importlib.metadata
+import inspect
+from concurrent.futures import ThreadPoolExecutor
 from PIL import Image # Required for image conversion (install with: pip install Pillow)
 
-def run_pyinstaller(script_name, icon_path=None):
+APP_NAME = 'MonitorInputSwitch'
+DATA_FILES = ['background.jpg', 'monitor_icon.jpg', 'dark_icon.png']
+# Local modules bundled via --hidden-import; a change in any of them needs a rebuild
+LOCAL_MODULES = ['samsung_tizen_controller.py', 'monitor_manager.py', 'control_logic.py']
+# Third-party distributions bundled into the exe; an upgrade of any needs a rebuild
+BUNDLED_DISTS = ['pillow', 'monitorcontrol', 'samsungtvws', 'websocket-client', 'requests']
+# Where the input digest of the last successful build is kept
+BUILD_CACHE_DIR = os.environ.get('BUILD_CACHE_DIR', 'build')
+
+def _build_cache_key(command, files, extra=()):
+    """Digest of everything that affects the build output."""
+    h = hashlib.blake2b(digest_size=16)
+    h.update(sys.version.encode())
+    for dist in ['pyinstaller', *BUNDLED_DISTS]:
+        try:
+            h.update(f"{dist}=={importlib.metadata.version(dist)}".encode())
+        except importlib.metadata.PackageNotFoundError:
+            h.update(f"{dist}=<missing>".encode())
+    h.update("\0".join([*command, *extra]).encode())
+    for path in files:
+        h.update(path.encode())
+        try:
+            with open(path, 'rb') as f:
+                h.update(f.read())
+        except OSError:
+            h.update(b"<missing>")
+    return h.hexdigest()
+
+ICO_SIZES = [(16, 16), (32, 32), (48, 48), (256, 256)]
+
+def _ico_frame(img, size):
+    # Same scaling Pillow's ICO writer applies to each size on its own
+    frame = img.copy()
+    frame.thumbnail(size, Image.Resampling.LANCZOS, reducing_gap=None)
+    return frame
+
+def _encode_ico(img, sizes=ICO_SIZES):
+    """
+    Encode img as a multi-size ICO. The LANCZOS downscales release the GIL,
+    so each size is resized on its own thread and handed to the ICO writer
+    ready-made instead of being resized serially inside save().
+    """
+    sizes = [sz for sz in sizes if sz[0] <= img.width and sz[1] <= img.height]
+    with ThreadPoolExecutor(max_workers=len(sizes) or 1) as ex:
+        frames = list(ex.map(lambda sz: _ico_frame(img, sz), sizes))
+    # The writer matches frames by exact size; thumbnail() keeps the aspect ratio
+    frames.sort(key=lambda f: f.size, reverse=True)
+    buf = io.BytesIO()
+    frames[0].save(buf, format='ICO', sizes=[f.size for f in frames], append_images=frames[1:])
+    return buf.getvalue()
+
+def _ico_convert_tag():
+    """Short digest of the icon conversion (sizes, code, Pillow version)."""
+    h = hashlib.blake2b(digest_size=4)
+    h.update(repr(ICO_SIZES).encode())
+    h.update(inspect.getsource(_ico_frame).encode())
+    h.update(inspect.getsource(_encode_ico).encode())
+    h.update(Image.__version__.encode())
+    return h.hexdigest()
+
+def _pillow_simd_hint():
+    try:
+        importlib.metadata.version('pillow-simd')
+    except importlib.metadata.PackageNotFoundError:
+        print("Hint: 'pip install pillow-simd' (in place of Pillow) speeds up the icon conversion.")
+
+def _dist_path():
+    return os.path.join('dist', APP_NAME + ('.exe' if sys.platform == "win32" else ''))
+
+def run_pyinstaller(script_name, icon_path=None, force=False):
     # Determine OS-specific separator for --add-data paths
     if sys.platform == "win32":
         data_sep = ";"
@@ -19,10 +92,8 @@ def run_pyinstaller(script_name, icon_path=None):
         '-m', 'PyInstaller',
         '--onefile',
         '--windowed',
-        '--name', 'MonitorInputSwitch',
-        f'--add-data=background.jpg{data_sep}.',
-        f'--add-data=monitor_icon.jpg{data_sep}.',
-        f'--add-data=dark_icon.png{data_sep}.',
+        '--name', APP_NAME,
+        *[f'--add-data={data_file}{data_sep}.' for data_file in DATA_FILES],
         '--hidden-import=samsung_tizen_controller',
         '--hidden-import=monitor_manager',
         '--hidden-import=control_logic',
@@ -30,10 +101,32 @@ def run_pyinstaller(script_name, icon_path=None):
         '--hidden-import=monitorcontrol',
         '--hidden-import=samsungtvws',
         '--hidden-import=websocket',
+        # samsungtvws subpackages the local Tizen control never uses
+        '--exclude-module=samsungtvws.encrypted',
+        '--exclude-module=samsungtvws.cli',
     ]
 
+    # --- Build Cache ---
+    # Skip the whole PyInstaller run (and the icon conversion) when none of the
+    # inputs changed since the last successful build
+    cache_file = os.path.join(BUILD_CACHE_DIR, '.cache_key')
+    # This script too: a change to the command or icon conversion needs a rebuild
+    cache_inputs = [script_name, *LOCAL_MODULES, *DATA_FILES, 'requirements.txt',
+                    os.path.abspath(__file__)]
+    if icon_path:
+        cache_inputs.append(icon_path)
+    ico_tag = _ico_convert_tag()
+    cache_key = _build_cache_key(command, cache_inputs, extra=[ico_tag])
+    if not force and os.path.exists(_dist_path()):
+        try:
+            with open(cache_file, 'r') as f:
+                if f.read().strip() == cache_key:
+                    print(f"Build inputs unchanged, skipping PyInstaller ({_dist_path()} is up to date). Use --force to rebuild.")
+                    return
+        except OSError:
+            pass
+
     # --- Icon Handling Logic ---
-    temp_icon_file = None # To store path to temporary icon if needed
     actual_icon_path_to_use = None
 
     if icon_path:
@@ -43,28 +136,36 @@ def run_pyinstaller(script_name, icon_path=None):
 
         # Check if conversion is needed (Windows specifically needs .ico)
         if sys.platform == "win32" and not icon_path.lower().endswith(required_icon_ext):
-            print(f"Icon '{icon_path}' is not a {required_icon_ext} file. Attempting automatic conversion...")
             try:
-                # Create a temporary file with .ico suffix
-                # Using delete=False and manual cleanup in finally for robustness
-                fd, temp_icon_file = tempfile.mkstemp(suffix=required_icon_ext)
-                os.close(fd) # Close the file descriptor
-
-                img = Image.open(icon_path)
-                # Save as ICO, potentially specifying multiple sizes for better results
-                img.save(temp_icon_file, format='ICO', sizes=[(16,16), (32, 32), (48, 48), (64, 64), (256, 256)])
-                print(f"Successfully converted '{icon_path}' to temporary icon '{temp_icon_file}'")
-                actual_icon_path_to_use = temp_icon_file
+                # Converted icons are kept next to the build cache, keyed by the
+                # source's mtime and size and by the conversion itself, so repeat
+                # builds skip Pillow entirely but a changed ICO_SIZES/encoder doesn't
+                st = os.stat(icon_path)
+                stem = os.path.splitext(os.path.basename(icon_path))[0]
+                converted_icon = os.path.join(BUILD_CACHE_DIR, f"{stem}.{st.st_mtime_ns}.{st.st_size}.{ico_tag}{required_icon_ext}")
+                if os.path.exists(converted_icon):
+                    print(f"Using cached converted icon '{converted_icon}'")
+                else:
+                    print(f"Icon '{icon_path}' is not a {required_icon_ext} file. Attempting automatic conversion...")
+                    img = Image.open(icon_path)
+                    img.load()
+                    img = img.convert("RGBA")
+                    _pillow_simd_hint()
+                    # Encode in memory; PyInstaller's --icon needs a path, so the
+                    # finished ICO is written exactly once. 64x64 is left out, the
+                    # shell doesn't use it and scales from 48/256 if asked.
+                    ico_bytes = _encode_ico(img)
+                    os.makedirs(BUILD_CACHE_DIR, exist_ok=True)
+                    with open(converted_icon, 'wb') as f:
+                        f.write(ico_bytes)
+                    print(f"Successfully converted '{icon_path}' to '{converted_icon}'")
+                actual_icon_path_to_use = converted_icon
             except ImportError:
                 print("Error: Pillow library not found. Cannot convert icon.")
                 print("Please install it: pip install Pillow")
-                if temp_icon_file and os.path.exists(temp_icon_file):
-                    os.remove(temp_icon_file) # Clean up if temp file was created before error
                 sys.exit(1)
             except Exception as e:
                 print(f"Error converting icon '{icon_path}' to {required_icon_ext}: {e}")
-                if temp_icon_file and os.path.exists(temp_icon_file):
-                    os.remove(temp_icon_file) # Clean up on conversion error
                 # Optionally fallback to no icon or exit
                 print("Proceeding without a custom icon.")
                 actual_icon_path_to_use = None # Reset path if conversion failed
@@ -81,7 +182,7 @@ def run_pyinstaller(script_name, icon_path=None):
     # Add the script name itself
     command.append(script_name)
 
-    # Add the icon command if we have a valid path (original or temporary)
+    # Add the icon command if we have a valid path (original or converted)
     if actual_icon_path_to_use:
         command.extend(['--icon', actual_icon_path_to_use])
 
@@ -89,32 +190,35 @@ def run_pyinstaller(script_name, icon_path=None):
     # --- Execute PyInstaller ---
     try:
         print(f"Running command: {' '.join(command)}")
-        result = subprocess.run(command, check=True, capture_output=True, text=True, encoding='utf-8')
-        print("PyInstaller output:\n", result.stdout)
+        # Stream PyInstaller's log as it is produced instead of buffering all of it
+        with subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                              text=True, encoding='utf-8', errors='replace', bufsize=1) as proc:
+            for line in proc.stdout:
+                sys.stdout.write(line)
+        if proc.returncode:
+            raise subprocess.CalledProcessError(proc.returncode, command)
         print(f"{script_name} successfully built into an executable.")
+        try:
+            os.makedirs(BUILD_CACHE_DIR, exist_ok=True)
+            with open(cache_file, 'w') as f:
+                f.write(cache_key)
+        except OSError as e:
+            print(f"Warning: Could not write build cache key: {e}")
     except subprocess.CalledProcessError as e:
         print(f"Error occurred during PyInstaller execution:")
         print(f"Command: {' '.join(e.cmd)}")
         print(f"Return code: {e.returncode}")
-        print(f"Output:\n{e.stdout}")
-        print(f"Error Output:\n{e.stderr}")
+        print("See the PyInstaller output above for details.")
         sys.exit(1)
     except FileNotFoundError as e:
         print(f"Error: Could not find Python executable or PyInstaller module.")
         print(e)
         sys.exit(1)
-    finally:
-        # --- Cleanup: Remove temporary icon file if created ---
-        if temp_icon_file and os.path.exists(temp_icon_file):
-            try:
-                os.remove(temp_icon_file)
-                print(f"Removed temporary icon file: {temp_icon_file}")
-            except OSError as e:
-                print(f"Warning: Could not remove temporary icon file '{temp_icon_file}': {e}")
 
 
 if __name__ == "__main__":
     # Use dark_icon.png as the application icon
     icon_to_use = 'dark_icon.png'
     
-    run_pyinstaller('app_ui.py', icon_to_use)
\ No newline at end of file
+    force = '-f' in sys.argv[1:] or '--force' in sys.argv[1:]
+    run_pyinstaller('app_ui.py', icon_to_use, force=force)
\ No newline at end of file
@@ -4,22 +4,61 @@ Uses samsungtvws library to launch Tizen apps corresponding to input sources.
 Works entirely on local network - NO cloud/internet required.
 """
 
-import os
-import json
-from samsungtvws import SamsungTVWS
+import re
+import sys
+import time
+import functools
+import logging
+import threading
+from types import MappingProxyType
+
+_log = logging.getLogger(__name__)
+
+@functools.lru_cache(maxsize=None)
+def _get_tvws_class():
+    # samsungtvws pulls in websocket-client, ssl and requests; import it only when
+    # a connection is actually made, not whenever this module is imported
+    from samsungtvws import SamsungTVWS
+    return SamsungTVWS
+
+# Source-name matchers; case-insensitive so callers needn't upper() first
+_HDMI_RE = re.compile(r"HDMI", re.I)
+_DP_RE = re.compile(r"DP|DISPLAYPORT|USB", re.I)
+
+# Seconds between WebSocket pings while a connection is held open
+KEEPALIVE_INTERVAL = 30
+# Backoff between connect attempts while waiting for the pairing popup
+PAIRING_RETRY_DELAYS = (1, 2, 4, 8, 16)
 
 class SamsungTizenController:
     """Local control for Samsung G8 monitor via Tizen app launching"""
     
-    # Tizen app IDs for input sources on G8 OLED
-    INPUT_APP_MAP = {
-        "HDMI1": "org.tizen.viewer.hdmi1",
-        "HDMI2": "org.tizen.viewer.hdmi2", 
-        "DP1": "org.tizen.viewer.dp1",
-        "USB-C": "org.tizen.viewer.dp1",  # DP1 is usually USB-C on G8
+    # Input names the macro understands. The matching Tizen viewer apps on the
+    # G8 OLED are org.tizen.viewer.hdmi1 / .hdmi2 / .dp1 (DP1 is usually USB-C).
+    SUPPORTED_INPUTS = frozenset({"HDMI1", "HDMI2", "DP1", "USB-C"})
+    
+    # Input switch macros as (key, settle_seconds) steps, built once. The
+    # '123/Gear' menu opens with the cursor on the active source, so the
+    # navigation is relative: HDMI -> DP is one RIGHT, DP -> HDMI one LEFT.
+    # The settle times include the 1 s samsungtvws used to sleep after every
+    # key (its default key_press_delay); keys are now sent with no library
+    # delay, so the only waits are these, and none follows the final ENTER.
+    _OPEN_SOURCES = (("KEY_MORE", 3.0), ("KEY_ENTER", 3.0))
+    _SELECT = (("KEY_ENTER", 0),)
+    _MACROS = {
+        ("HDMI", "DP"): ("Move RIGHT (HDMI -> DP)", _OPEN_SOURCES + (("KEY_RIGHT", 1.5),) + _SELECT),
+        ("DP", "HDMI"): ("Move LEFT (DP -> HDMI)", _OPEN_SOURCES + (("KEY_LEFT", 1.5),) + _SELECT),
     }
+    # Anything else re-selects the current source
+    _NO_MOVE_MACRO = _OPEN_SOURCES + _SELECT
+    # Upper-cased source names -> macro kind, built once
+    _SOURCE_KINDS = MappingProxyType({
+        "HDMI1": "HDMI", "HDMI2": "HDMI", "HDMI 1": "HDMI", "HDMI 2": "HDMI",
+        "DP1": "DP", "DISPLAYPORT 1": "DP", "USB-C": "DP",
+    })
     
-    def __init__(self, ip_address, token_file="samsung_token.txt", initial_state="DP1"):
+    def __init__(self, ip_address, token_file="samsung_token.txt", initial_state="DP1",
+                 settle_scale=1.0, device_name=None):
         """
         Initialize Samsung Tizen controller.
         
@@ -27,87 +66,174 @@ class SamsungTizenController:
             ip_address: IP address of the Samsung monitor
             token_file: Path to file for storing auth token
             initial_state: The current known state (HDMI1, DP1, etc.)
+            settle_scale: Multiplier for the OSD settle delays in the switch
+                macro (e.g. 0.5 for a monitor whose menus open quickly)
+            device_name: Name recorded at pairing time. When given, connect()
+                trusts the existing pairing and skips the REST device-info probe
         """
         self.ip_address = ip_address
+        self.settle_scale = settle_scale
         self.token_file = token_file
-        self.token = self._load_token()
         self.tv = None
+        self._keepalive = None
+        # Guards _keepalive against a tick rescheduling while (re)connecting
+        self._keepalive_lock = threading.Lock()
+        self.device_name = device_name
         # Track current state (Initialized to DisplayPort/DP1 as requested)
         # Assuming typical setup: HDMI1 is Left, DP1 is Right
         self.current_app_state = self._normalize_state(initial_state)
 
     def _normalize_state(self, state):
-        s = str(state).upper()
-        if "HDMI" in s: return "HDMI1"
-        if "DP" in s or "DISPLAYPORT" in s or "USB" in s: return "DP1"
+        s = str(state)
+        if _HDMI_RE.search(s): return "HDMI1"
+        if _DP_RE.search(s): return "DP1"
         # Default
         return "DP1" 
         
-    def _load_token(self):
-        """Load saved token from file."""
-        if os.path.exists(self.token_file):
-            try:
-                with open(self.token_file, 'r') as f:
-                    return f.read().strip()
-            except:
-                pass
+    @classmethod
+    def _source_kind(cls, s):
+        # Exact hit for the names the app actually passes; scan only otherwise
+        kind = cls._SOURCE_KINDS.get(s)
+        if kind:
+            return kind
+        if _HDMI_RE.search(s): return "HDMI"
+        if _DP_RE.search(s): return "DP"
         return None
-    
-    def _save_token(self, token):
-        """Save token to file for future use."""
-        try:
-            with open(self.token_file, 'w') as f:
-                f.write(token)
-            print(f"Token saved to {self.token_file}")
-        except Exception as e:
-            print(f"Warning: Could not save token: {e}")
-    
-    def connect(self):
+
+    @classmethod
+    @functools.lru_cache(maxsize=32)
+    def _macro_for(cls, current, target):
+        """(action, steps) for a (current, target) pair, or None if no move applies.
+        Memoized: the app only ever switches between a handful of names."""
+        return cls._MACROS.get((cls._source_kind(current), cls._source_kind(target)))
+        
+    def connect(self, wait_for_pairing=False):
         """
         Establish connection to the monitor.
         On first run, user must accept the pairing popup on the monitor.
         
+        Args:
+            wait_for_pairing: If the monitor answers 'unauthorized', keep
+                retrying (PAIRING_RETRY_DELAYS backoff) while the user accepts
+                the popup, instead of giving up on the first attempt
+        
         Returns:
             True if connected, False otherwise
         """
-        try:
-            print(f"Connecting to {self.ip_address}:8002...")
-            
-            # Create connection with token_file (library handles token saving/loading)
-            self.tv = SamsungTVWS(
-                host=self.ip_address,
-                port=8002,
-                token_file=self.token_file,  # Let library manage token
-                timeout=30,
-                name="MonitorSwitcher"
-            )
-            
-            # Test connection by getting device info
-            info = self.tv.rest_device_info()
-            print(f"✓ Connected to: {info.get('device', {}).get('name', 'Samsung Monitor')}")
-            
+        delays = PAIRING_RETRY_DELAYS if wait_for_pairing else ()
+        prompted = False
+        for attempt in range(len(delays) + 1):
+            try:
+                print(f"Connecting to {self.ip_address}:8002...")
+                
+                # Create connection with token_file (library handles token saving/loading)
+                self.tv = _get_tvws_class()(
+                    host=self.ip_address,
+                    port=8002,
+                    token_file=self.token_file,  # Let library manage token
+                    timeout=30,
+                    name="MonitorSwitcher"
+                )
+                
+                if self.device_name:
+                    # Recently paired: the WebSocket open below is test enough
+                    print(f"✓ Connecting to: {self.device_name} (cached pairing)")
+                else:
+                    # Test connection by getting device info
+                    info = self.tv.rest_device_info()
+                    self.device_name = info.get('device', {}).get('name', 'Samsung Monitor')
+                    print(f"✓ Connected to: {self.device_name}")
+                
+                # Open the WebSocket now rather than on the first key press, so the
+                # handshake (and pairing, on first run) isn't paid mid-macro
+                self.tv.open()
+                self._schedule_keepalive()
+                return True
+                
+            except Exception as e:
+                # Don't leave a half-built client behind that looks connected
+                self.tv = None
+                if "unauthorized" not in str(e).lower() and type(e).__name__ != "UnauthorizedError":
+                    print(f"Connection error: {e}")
+                    return False
+                if not prompted:
+                    print("\n⚠️  PAIRING REQUIRED!")
+                    print("Check your Samsung G8 monitor screen for a popup.")
+                    print("Use the monitor's remote/buttons to select 'Allow'.")
+                    if not delays:
+                        print("Then run this script again.")
+                    prompted = True
+                if attempt == len(delays):
+                    return False
+                print(f"Waiting for 'Allow'... retrying in {delays[attempt]}s")
+                time.sleep(delays[attempt])
+        return False
+    
+    def is_connected(self):
+        """True if a client exists and its WebSocket (if opened yet) is still up."""
+        tv = self.tv
+        return tv is not None and (tv.connection is None or tv.is_alive())
+
+    def ensure_connected(self):
+        """
+        Reuse the current connection, reconnecting only if there is none or
+        the monitor dropped it. Cheaper than connect(), which always does the
+        REST device-info round-trip and a fresh WebSocket handshake.
+        """
+        if self.is_connected():
             return True
-            
+        self.disconnect()
+        return self.connect()
+
+    def _schedule_keepalive(self, interval=KEEPALIVE_INTERVAL, tv=None):
+        # Each chain is bound to the client it was started for; once self.tv
+        # is replaced or cleared, the chain stops instead of running alongside
+        # the new connection's
+        with self._keepalive_lock:
+            tv = tv or self.tv
+            if tv is None or tv is not self.tv:
+                return
+            timer = threading.Timer(interval, self._keepalive_tick, args=(tv, interval))
+            timer.daemon = True
+            self._keepalive = timer
+            timer.start()
+
+    def _keepalive_tick(self, tv, interval):
+        # Ping the open WebSocket so the monitor doesn't drop it while idle.
+        # A failed ping just stops the timer; is_connected() notices the dead
+        # socket and the next switch reconnects.
+        if tv is not self.tv:
+            return
+        try:
+            if tv.connection is not None:
+                tv.connection.ping()
         except Exception as e:
-            if "unauthorized" in str(e).lower():
-                print("\n⚠️  PAIRING REQUIRED!")
-                print("Check your Samsung G8 monitor screen for a popup.")
-                print("Use the monitor's remote/buttons to select 'Allow'.")
-                print("Then run this script again.")
-            else:
-                print(f"Connection error: {e}")
-            return False
-    
-    def set_input_source(self, source, use_macro=True):
+            print(f"Keepalive ping failed: {e}")
+            return
+        self._schedule_keepalive(interval, tv)
+
+    def set_input_source(self, source, use_macro=True, force=False):
         """
         Switch monitor input using '123/Gear' Menu Navigation (Relative).
         Assumption: Cursor starts on current active source.
         Logic:
            HDMI -> DP : Move RIGHT
            DP -> HDMI : Move LEFT
+        
+        All keys of the macro go over the one WebSocket session held by
+        self.tv (samsungtvws reuses its open connection per key); a missing or
+        dropped session is re-established here instead of failing the switch.
+        
+        If the tracked state is already on the target's input kind the macro
+        would only re-select it, so it is skipped unless force=True.
         """
-        if not self.tv:
-            print("Not connected. Call connect() first.")
+        kind = self._source_kind(source.upper())
+        if not force and kind and kind == self._source_kind(self.current_app_state.upper()):
+            _log.debug("Already on %s, skipping macro", self.current_app_state)
+            return True
+        
+        if not self.ensure_connected():
+            print("Could not connect to the monitor.")
             return False
             
         # Normalize target
@@ -115,56 +241,54 @@ class SamsungTizenController:
         # Normalize internal state just in case
         current = self.current_app_state.upper()
         
-        # Helper to categorize
-        def is_hdmi(s): return "HDMI" in s
-        def is_dp(s): return "DP" in s or "USB" in s or "DISPLAYPORT" in s
-        
-        print(f"Request source: {target} (Current State: {current})")
-        
-        import time
+        # Per-switch chatter goes to DEBUG with %-args, so nothing is formatted
+        # or written to stdout unless debug logging is on
+        _log.debug("Request source: %s (Current State: %s)", target, current)
         
         try:
-            print("Executing Input Switch Macro (Relative)...")
-            
-            # Step 1: Open Quick Menu
-            self.send_key("KEY_MORE") 
-            time.sleep(2.0)
-            
-            # Step 2: Enter 'Sources'
-            self.send_key("KEY_ENTER")
-            time.sleep(2.0)
-            
-            # Step 3: Relative Navigation
-            # This assumes the cursor is currently ON the active source
-            
-            if is_hdmi(current) and is_dp(target):
-                print("Action: Move RIGHT (HDMI -> DP)")
-                self.send_key("KEY_RIGHT")
-                time.sleep(0.5)
-                
-            elif is_dp(current) and is_hdmi(target):
-                print("Action: Move LEFT (DP -> HDMI)")
-                self.send_key("KEY_LEFT")
-                time.sleep(0.5)
+            _log.debug("Executing Input Switch Macro (Relative)...")
             
+            macro = self._macro_for(current, target)
+            if macro:
+                action, steps = macro
+                _log.debug("Action: %s", action)
             else:
-                print(f"No movement logic for {current} -> {target}. Selecting current.")
-
-            # Step 4: Select
-            self.send_key("KEY_ENTER")
+                _log.debug("No movement logic for %s -> %s. Selecting current.", current, target)
+                steps = self._NO_MOVE_MACRO
+            
+            # Bail out if the first key fails (e.g. the socket was dropped) so the
+            # caller can reconnect instead of sending the rest of the macro blind
+            if not self.send_keys(steps):
+                return False
             
             # Update internal state
             self.current_app_state = target
-            print(f"State updated to: {self.current_app_state}")
+            _log.debug("State updated to: %s", self.current_app_state)
             return True
             
         except Exception as e:
             print(f"Error executing macro: {e}")
             return False
-            
-        except Exception as e:
-            print(f"Error executing macro: {e}")
-            return False
+
+    def send_keys(self, steps):
+        """
+        Send (key, settle_seconds) steps back-to-back over the open WebSocket.
+        Frames are written without waiting for a reply, and each settle delay
+        counts from when its key was sent, so the round-trip overlaps the OSD's
+        settle time instead of adding to it. Steps with a 0 delay follow
+        immediately.
+        
+        Returns:
+            False if the first key could not be sent, True otherwise
+        """
+        for n, (key, settle_s) in enumerate(steps):
+            sent_at = time.perf_counter()
+            if not self.send_key(key, key_press_delay=0) and n == 0:
+                return False
+            remaining = settle_s * self.settle_scale - (time.perf_counter() - sent_at)
+            if remaining > 0:
+                time.sleep(remaining)
+        return True
 
 
     def get_installed_apps(self):
@@ -186,12 +310,14 @@ class SamsungTizenController:
             print(f"Failed to get app list: {e}")
             return []
     
-    def send_key(self, key_code):
+    def send_key(self, key_code, key_press_delay=None):
         """
         Send a remote control key press (fallback method).
         
         Args:
             key_code: Samsung key code (e.g., "KEY_SOURCE", "KEY_HOME")
+            key_press_delay: Seconds samsungtvws sleeps after the key
+                (None = the library default of 1 s)
         
         Returns:
             True if successful, False otherwise
@@ -201,7 +327,7 @@ class SamsungTizenController:
             return False
         
         try:
-            self.tv.send_key(key_code)
+            self.tv.send_key(key_code, key_press_delay=key_press_delay)
             return True
         except Exception as e:
             print(f"Failed to send key {key_code}: {e}")
@@ -209,16 +335,23 @@ class SamsungTizenController:
     
     def disconnect(self):
         """Close connection."""
-        if self.tv:
+        # Clear tv under the lock too, so an in-flight tick can't reschedule
+        with self._keepalive_lock:
+            if self._keepalive:
+                self._keepalive.cancel()
+                self._keepalive = None
+            tv, self.tv = self.tv, None
+        if tv:
             try:
-                self.tv.close()
+                tv.close()
             except:
                 pass
-            self.tv = None
 
 
 # Test/demo code
 if __name__ == "__main__":
+    # The interactive test wants to see every macro step
+    logging.basicConfig(level=logging.DEBUG, format='%(message)s')
     print("=" * 70)
     print("Samsung G8 Monitor - Local Tizen Control Test")
     print("=" * 70)
@@ -240,10 +373,14 @@ if __name__ == "__main__":
         print("\n❌ Connection failed")
         exit(1)
     
+    # app_list() is a slow round-trip with a large JSON reply, and switching
+    # doesn't use app IDs; only enumerate with --list-apps
     print("\n[2/4] Getting installed apps...")
-    apps = controller.get_installed_apps()
+    apps = controller.get_installed_apps() if "--list-apps" in sys.argv else None
     
-    if apps:
+    if apps is None:
+        print("Skipped (pass --list-apps to enumerate)")
+    elif apps:
         print(f"Found {len(apps)} installed apps")
         print("\nInput-related apps:")
         for app in apps:
@@ -255,7 +392,7 @@ if __name__ == "__main__":
         print("Could not retrieve app list (may not be supported)")
     
     print("\n[3/4] Testing input switching...")
-    print("Available inputs:", ", ".join(controller.INPUT_APP_MAP.keys()))
+    print("Available inputs:", ", ".join(sorted(controller.SUPPORTED_INPUTS)))
     
     test_input = input("\nWhich input to test? (e.g., HDMI1, DP1): ").strip()
     
@@ -3,19 +3,30 @@ import json
 import logging
 import time
 import ssl
-import os
 from samsung_tizen_controller import SamsungTizenController
+from monitor_manager import TIZEN_TOKEN_FILE
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(message)s')
 
 def save_local_config(ip, mac, name):
-    config = {
+    # Update rather than replace: keep user settings such as osd_settle_scale
+    try:
+        with open("local_config.json", "r") as f:
+            config = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        config = {}
+    if not isinstance(config, dict):
+        config = {}
+    config.update({
         "use_local_control": True,
         "monitor_ip": ip,
         "monitor_mac": mac,
-        "monitor_name": name
-    }
+        "monitor_name": name,
+        # Lets the app trust this pairing and skip its device-info probe
+        "device_name": name,
+        "token_ts": time.time()
+    })
     with open("local_config.json", "w") as f:
         json.dump(config, f, indent=4)
     print(f"\n✅ Configuration saved to local_config.json")
@@ -39,10 +50,8 @@ if __name__ == "__main__":
         
     print(f"\nAttempting to connect to {ip_address}...")
     
-    # Define Token Path (AppData) to match App behavior
-    app_data_dir = os.path.join(os.environ.get('APPDATA', '.'), 'MonitorInputSwitch')
-    os.makedirs(app_data_dir, exist_ok=True)
-    token_file = os.path.join(app_data_dir, "samsung_g8_token.txt")
+    # Pair into the same token file the app reads
+    token_file = TIZEN_TOKEN_FILE
     print(f"Token will be saved to: {token_file}")
     
     # Try one connection to trigger the Auth popup
@@ -52,13 +61,14 @@ if __name__ == "__main__":
     print("--> Use the remote to select 'Allow' if asked.")
     
     try:
-        # Connect triggers the auth flow
-        if controller.connect():
+        # Connect triggers the auth flow; keep retrying while the popup is open
+        # instead of making the user rerun the script
+        if controller.connect(wait_for_pairing=True):
             print("\n✅ Success! Paired with monitor.")
             
             # The token is handled automatically by the library and saved to samsung_token.txt by default
             
-            save_local_config(ip_address, "Unknown-MAC", "Samsung Monitor")
+            save_local_config(ip_address, "Unknown-MAC", controller.device_name or "Samsung Monitor")
             
             print("\nYou can now build the EXE or run the app.")
         else: